@@ -6,9 +6,12 @@ LOG_EMOJIS = {
     'webhook': '🌐', 'playback': '🎬', 'dummy': '📁', 'search': '🔍',
     'delete': '🗑️', 'update': '🔄', 'warning': '⚠️',
     'processing': '⏳', 'monitored': '👀', 'progress': '🔄',
-    'tracking': '⏳', 'tv': '📺'
+    'tracking': '⏳', 'tv': '📺', 'cleanup': '🧹'
 }
 
+# One shared `extra` mapping per emoji type so log calls don't allocate a dict each time
+LOG_EXTRA = {emoji_type: {'emoji_type': emoji_type} for emoji_type in LOG_EMOJIS}
+
 class EmojiLogFormatter(logging.Formatter):
     def format(self, record):
         emoji = LOG_EMOJIS.get(record.__dict__.get('emoji_type', ''), '➡️')
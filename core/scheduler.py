@@ -0,0 +1,53 @@
+import heapq, itertools, threading, time
+from core.logger import logger, LOG_EXTRA
+
+class Scheduler:
+    """Run delayed callbacks from a single daemon thread instead of one Timer thread per call"""
+
+    def __init__(self):
+        self._queue = []  # heap of (due, seq, func, args)
+        self._counter = itertools.count()
+        self._cond = threading.Condition(threading.Lock())  # never re-entered, so no RLock needed
+        self._thread = None
+        self._pending = set()  # ids of tasks still waiting to run
+
+    def schedule(self, delay, func, *args):
+        """Run func(*args) after delay seconds and return the id of the scheduled task"""
+        with self._cond:
+            task_id = next(self._counter)
+            heapq.heappush(self._queue, (time.monotonic() + delay, task_id, func, args))
+            self._pending.add(task_id)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="scheduler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return task_id
+
+    def cancel(self, task_id):
+        """Drop a scheduled task; it is skipped when it comes due"""
+        with self._cond:
+            self._pending.discard(task_id)
+            # Cancelled entries normally just wait to be popped; rebuild once they dominate the heap
+            if len(self._queue) > 2 * len(self._pending) + 64:
+                self._queue = [entry for entry in self._queue if entry[1] in self._pending]
+                heapq.heapify(self._queue)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    if self._queue and self._queue[0][0] <= now:
+                        break
+                    self._cond.wait(self._queue[0][0] - now if self._queue else None)
+                _, task_id, func, args = heapq.heappop(self._queue)
+                try:
+                    self._pending.remove(task_id)
+                except KeyError:  # cancelled
+                    continue
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Scheduled task {getattr(func, '__name__', func)} failed: {e}", extra=LOG_EXTRA['error'])
+
+scheduler = Scheduler()
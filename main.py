@@ -2,16 +2,11 @@ import sys
 import os
 import subprocess
 import time
-from dotenv import load_dotenv
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from fastapi import FastAPI, Request
-from core.logger import logger
+from fastapi.concurrency import run_in_threadpool
+from core.logger import logger, LOG_EXTRA
 from services.handlers import handle_webhook
 
-# Load environment variables
-load_dotenv()
-
 def clear_port(port: int, max_attempts: int = 3) -> bool:
     """Clear a port if it's in use"""
     for attempt in range(max_attempts):
@@ -24,12 +19,12 @@ def clear_port(port: int, max_attempts: int = 3) -> bool:
                     if line:
                         pid = line.split()[1]
                         subprocess.run(['kill', '-9', pid])
-                        logger.info(f"Killed process {pid} using port {port}", extra={'emoji_type': 'info'})
+                        logger.info(f"Killed process {pid} using port {port}", extra=LOG_EXTRA['info'])
                 time.sleep(1)  # Wait for port to clear
                 return True
             return True  # Port wasn't in use
         except Exception as e:
-            logger.warning(f"Attempt {attempt + 1} to clear port {port} failed: {e}", extra={'emoji_type': 'warning'})
+            logger.warning(f"Attempt {attempt + 1} to clear port {port} failed: {e}", extra=LOG_EXTRA['warning'])
             if attempt == max_attempts - 1:
                 return False
             time.sleep(1)
@@ -40,11 +35,11 @@ def check_port(port: int) -> bool:
     try:
         result = subprocess.run(['lsof', '-i', f':{port}'], capture_output=True, text=True)
         if result.stdout:
-            logger.error(f"Port {port} is already in use. Please update APP_PORT in your .env file.", extra={'emoji_type': 'error'})
+            logger.error(f"Port {port} is already in use. Please update APP_PORT in your .env file.", extra=LOG_EXTRA['error'])
             return False
         return True
     except Exception as e:
-        logger.error(f"Failed to check port {port}: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Failed to check port {port}: {e}", extra=LOG_EXTRA['error'])
         return False
 
 app = FastAPI()
@@ -55,10 +50,11 @@ async def webhook(request: Request):
         data = await request.json()
         # Extract source port from request
         source_port = request.client.port
-        response = handle_webhook(data, source_port)
+        # Handlers make blocking Plex/*arr calls, keep them off the event loop
+        response = await run_in_threadpool(handle_webhook, data, source_port)
         return response
     except Exception as e:
-        logger.error(f"Webhook handling failed: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Webhook handling failed: {e}", extra=LOG_EXTRA['error'])
         raise
 
 # ...other FastAPI endpoints if needed...
@@ -69,13 +65,13 @@ if __name__ == '__main__':
     # Get port from environment variable or exit if not set
     port = os.getenv('PLACEHOLDARR_PORT')
     if not port:
-        logger.error("PLACEHOLDARR_PORT not set in environment variables. Please set it in your .env file.", extra={'emoji_type': 'error'})
+        logger.error("PLACEHOLDARR_PORT not set in environment variables. Please set it in your .env file.", extra=LOG_EXTRA['error'])
         sys.exit(1)
     
     try:
         port = int(port)
     except ValueError:
-        logger.error(f"Invalid PLACEHOLDARR_PORT value: {port}. Must be a number.", extra={'emoji_type': 'error'})
+        logger.error(f"Invalid PLACEHOLDARR_PORT value: {port}. Must be a number.", extra=LOG_EXTRA['error'])
         sys.exit(1)
     
     if not check_port(port):
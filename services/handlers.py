@@ -1,24 +1,21 @@
-import os, re, threading, time, shutil, requests
+import os, re, sys, time, shutil
 from fastapi.responses import JSONResponse
 from core.config import settings
-from core.logger import logger
-from services.plex_client import plex, build_plex_url
+from core.logger import logger, LOG_EXTRA
+from services.plex_client import refresh_plex_section
 from services.integrations import (
-    place_dummy_file, delete_dummy_files, schedule_episode_request_update,
-    schedule_movie_request_update, check_media_has_file,
-    search_in_radarr, search_in_sonarr, trigger_sonarr_search
-)
-from services.utils import (
-    strip_movie_status, sanitize_filename, extract_episode_title, 
-    is_4k_request, strip_status_markers
+    place_dummy_file, delete_dummy_files, forget_placeholder_dirs, forget_sonarr_series,
+    schedule_episode_request_update, schedule_movie_request_update, check_media_has_file, is_monitored,
+    search_in_radarr, search_in_sonarr, trigger_sonarr_search, arr_session, ARR_TIMEOUT
 )
+from services.utils import strip_movie_status, sanitize_filename, is_4k_request
 
 def handle_webhook(data: dict, source_port: int = None):
     """Handle webhook with quality awareness"""
     source = data.get("instanceName", "Tautulli")
     
-    # Log incoming webhook but keep it brief
-    logger.debug(f"{source} payload: {data}", extra={'emoji_type': 'debug'})
+    # Log incoming webhook but keep it brief; %-args defer the payload repr until a handler emits it
+    logger.debug("%s payload: %s", source, data, extra=LOG_EXTRA['debug'])
     
     # Get file path for quality detection
     file_path = (data.get('media', {}).get('file_info', {}).get('path') or 
@@ -26,10 +23,10 @@ def handle_webhook(data: dict, source_port: int = None):
                  data.get('file', ''))
     
     is_4k = is_4k_request(file_path, source_port)
-    logger.debug(f"Quality determination: {'4K' if is_4k else 'Standard'}", extra={'emoji_type': 'debug'})
+    logger.debug("Quality determination: %s", '4K' if is_4k else 'Standard', extra=LOG_EXTRA['debug'])
     
     event_type = (data.get('event') or data.get('eventType') or 'unknown').lower()
-    logger.info(f"Received webhook event: {event_type}", extra={'emoji_type': 'webhook'})
+    logger.info(f"Received webhook event: {event_type}", extra=LOG_EXTRA['webhook'])
     
     # Handle import events directly for cleanup
     if event_type in ['download', 'moviefileimported', 'episodefileimported']:
@@ -52,7 +49,7 @@ def handle_webhook(data: dict, source_port: int = None):
         return handle_playback(data)
     else:
         # Fallback for unhandled events from other ARR providers
-        logger.info(f"Handling ARR import event: {data}", extra={'emoji_type': 'webhook'})
+        logger.info(f"Handling ARR import event: {data}", extra=LOG_EXTRA['webhook'])
         return JSONResponse({"status": "success", "message": "Import event processed"})
 
 def handle_import_event(data: dict, is_4k: bool = False):
@@ -65,12 +62,11 @@ def handle_import_event(data: dict, is_4k: bool = False):
             title = movie.get('title', 'Unknown Movie')
             year = movie.get('year')
             
-            logger.info(f"Processing movie import cleanup for: {title}", extra={'emoji_type': 'cleanup'})
+            logger.info(f"Processing movie import cleanup for: {title}", extra=LOG_EXTRA['cleanup'])
             delete_dummy_files('movie', title, year, tmdb_id, settings.MOVIE_LIBRARY_FOLDER)
             
             # Refresh Plex library
-            refresh_url = build_plex_url(f"library/sections/{settings.PLEX_MOVIE_SECTION_ID}/refresh")
-            requests.get(refresh_url, headers={'X-Plex-Token': settings.PLEX_TOKEN})
+            refresh_plex_section(settings.PLEX_MOVIE_SECTION_ID)
             
         elif 'episodes' in data and 'series' in data:
             # TV episode import handling
@@ -85,17 +81,16 @@ def handle_import_event(data: dict, is_4k: bool = False):
             
             # Format full episode identifier
             full_title = f"{series_title} - S{season_num:02d}E{episode_num:02d} - {episode_title}"
-            logger.info(f"Processing episode import cleanup for: {full_title}", extra={'emoji_type': 'cleanup'})
+            logger.info(f"Processing episode import cleanup for: {full_title}", extra=LOG_EXTRA['cleanup'])
             
             delete_dummy_files('tv', series_title, series.get('year'), tvdb_id, 
                               settings.TV_LIBRARY_FOLDER, season_number=season_num, episode_number=episode_num)
             
             # Refresh Plex library
-            refresh_url = build_plex_url(f"library/sections/{settings.PLEX_TV_SECTION_ID}/refresh")
-            requests.get(refresh_url, headers={'X-Plex-Token': settings.PLEX_TOKEN})
+            refresh_plex_section(settings.PLEX_TV_SECTION_ID)
             
     except Exception as e:
-        logger.error(f"Import cleanup failed: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Import cleanup failed: {e}", extra=LOG_EXTRA['error'])
     
     return JSONResponse({"status": "success", "message": "Import cleanup processed"})
 
@@ -109,15 +104,15 @@ def handle_seriesadd(data: dict, is_4k: bool = False):
     if not episodes:
         series_id = series.get('id')
         if series_id:
-            r = requests.get(f"{settings.SONARR_URL}/episode",
+            r = arr_session(settings.SONARR_URL, settings.SONARR_API_KEY).get(f"{settings.SONARR_URL}/episode",
                              params={'seriesId': series_id},
-                             headers={'X-Api-Key': settings.SONARR_API_KEY})
+                             timeout=ARR_TIMEOUT)
             r.raise_for_status()
             episodes = r.json()
         else:
-            logger.warning("No series ID provided in seriesadd event.", extra={'emoji_type': 'warning'})
+            logger.warning("No series ID provided in seriesadd event.", extra=LOG_EXTRA['warning'])
             episodes = []
-    unique_folders = set()
+    requested = []
     for ep in episodes:
         season_num = ep.get('seasonNumber')
         episode_num = ep.get('episodeNumber')
@@ -129,15 +124,12 @@ def handle_seriesadd(data: dict, is_4k: bool = False):
                                        episode_range=(episode_num, episode_num),
                                        episode_id=ep.get("id"))
         logger.info(f"Created dummy file for {series_title} S{season_num}E{episode_num} at {dummy_path}",
-                    extra={'emoji_type': 'dummy'})
-        series_folder = "/".join(dummy_path.split(os.sep)[:-2])
-        unique_folders.add(series_folder)
-        schedule_episode_request_update(series_title, season_num, episode_num, tvdb_id, delay=10, retries=5)
-    for folder in unique_folders:
-        # Refresh Plex folder
-        r = requests.get(build_plex_url(f"library/sections/{settings.PLEX_TV_SECTION_ID}/refresh"),
-                         headers={'X-Plex-Token': settings.PLEX_TOKEN})
-        r.raise_for_status()
+                    extra=LOG_EXTRA['dummy'])
+        requested.append((season_num, episode_num))
+    if requested:
+        # One section refresh picks up every new placeholder
+        refresh_plex_section(settings.PLEX_TV_SECTION_ID)
+        schedule_episode_request_update(series_title, requested, tvdb_id, delay=10, retries=5)
     return JSONResponse({"status": "success", "message": "SeriesAdd processed"})
 
 def handle_episodefiledelete(data: dict, is_4k: bool = False):
@@ -157,7 +149,7 @@ def handle_episodefiledelete(data: dict, is_4k: bool = False):
             if m:
                 season_num, episode_num = map(int, m.groups())
             else:
-                logger.info("Cannot determine season/episode from data", extra={'emoji_type': 'warning'})
+                logger.info("Cannot determine season/episode from data", extra=LOG_EXTRA['warning'])
                 continue
         dummy_path = place_dummy_file("tv", series_title, series_year, tvdb_id,
                                       settings.TV_LIBRARY_FOLDER,
@@ -165,35 +157,33 @@ def handle_episodefiledelete(data: dict, is_4k: bool = False):
                                       episode_range=(episode_num, episode_num),
                                       episode_id=ep.get("id"))
         logger.info(f"Re-created dummy file for {series_title} S{season_num}E{episode_num} at {dummy_path}",
-                    extra={'emoji_type': 'dummy'})
-        refresh_url = build_plex_url(f"library/sections/{settings.PLEX_TV_SECTION_ID}/refresh")
-        r = requests.get(refresh_url, headers={'X-Plex-Token': settings.PLEX_TOKEN})
-        r.raise_for_status()
-        schedule_episode_request_update(series_title, season_num, episode_num, tvdb_id, delay=10, retries=5)
+                    extra=LOG_EXTRA['dummy'])
+        refresh_plex_section(settings.PLEX_TV_SECTION_ID)
+        schedule_episode_request_update(series_title, [(season_num, episode_num)], tvdb_id, delay=10, retries=5)
     return JSONResponse({"status": "success", "message": "EpisodeFileDelete processed"})
 
+def movie_dummy_path(title, year, tmdb_id):
+    """Build the expected movie placeholder path; folder and file share one sanitized name"""
+    name = f"{sanitize_filename(title)}{f' ({year})' if year else ''}"
+    return os.path.join(settings.MOVIE_LIBRARY_FOLDER, f"{name} {{tmdb-{tmdb_id}}}", f"{name} (dummy).mp4")
+
 def handle_moviefiledelete(data: dict):
     if 'movie' in data:
         movie = data.get('movie', {})
         tmdb_id = movie.get('tmdbId') or data.get('remoteMovie', {}).get('tmdbId')
         if not tmdb_id:
-            logger.error("Missing TMDB ID for movie file delete", extra={'emoji_type': 'error'})
+            logger.error("Missing TMDB ID for movie file delete", extra=LOG_EXTRA['error'])
             return JSONResponse({"status": "error"}, status_code=400)
         title = movie.get('title', 'Unknown Movie')
         year = movie.get('year')
-        expected_dummy = os.path.join(settings.MOVIE_LIBRARY_FOLDER,
-                                      f"{sanitize_filename(title)}{' ('+str(year)+')' if year else ''} {{tmdb-{tmdb_id}}}",
-                                      f"{sanitize_filename(title)}{' ('+str(year)+')' if year else ''} (dummy).mp4")
+        expected_dummy = movie_dummy_path(title, year, tmdb_id)
         if not os.path.exists(expected_dummy):
             dummy_path = place_dummy_file("movie", title, year, tmdb_id, settings.MOVIE_LIBRARY_FOLDER)
-            logger.info(f"Created dummy file for movie '{title}' at {dummy_path}", extra={'emoji_type': 'dummy'})
-            folder = os.path.dirname(dummy_path)
-            refresh_url = build_plex_url(f"library/sections/{settings.PLEX_MOVIE_SECTION_ID}/refresh")
-            r = requests.get(refresh_url, headers={'X-Plex-Token': settings.PLEX_TOKEN})
-            r.raise_for_status()
-            schedule_movie_request_update(title, tmdb_id, delay=10, retries=5)
+            logger.info(f"Created dummy file for movie '{title}' at {dummy_path}", extra=LOG_EXTRA['dummy'])
+            refresh_plex_section(settings.PLEX_MOVIE_SECTION_ID)
+            schedule_movie_request_update(title, tmdb_id, delay=10, retries=5, year=year)
         else:
-            logger.info(f"Dummy file already exists for movie '{title}'", extra={'emoji_type': 'info'})
+            logger.info(f"Dummy file already exists for movie '{title}'", extra=LOG_EXTRA['info'])
     return JSONResponse({"status": "success", "message": "MovieFileDelete processed"})
 
 def handle_movie_delete(data: dict):
@@ -201,21 +191,16 @@ def handle_movie_delete(data: dict):
         movie = data.get('movie', {})
         tmdb_id = movie.get('tmdbId') or data.get('remoteMovie', {}).get('tmdbId')
         if not tmdb_id:
-            logger.error("Missing TMDB ID for movie delete", extra={'emoji_type': 'error'})
+            logger.error("Missing TMDB ID for movie delete", extra=LOG_EXTRA['error'])
             return JSONResponse({"status": "error"}, status_code=400)
-        dummy_path = os.path.join(settings.MOVIE_LIBRARY_FOLDER,
-                                  f"{sanitize_filename(movie.get('title', ''))}{' ('+str(movie.get('year'))+')' if movie.get('year') else ''} {{tmdb-{tmdb_id}}}",
-                                  f"{sanitize_filename(movie.get('title', ''))}{' ('+str(movie.get('year'))+')' if movie.get('year') else ''} (dummy).mp4")
+        dummy_path = movie_dummy_path(movie.get('title', ''), movie.get('year'), tmdb_id)
         if os.path.exists(dummy_path):
             os.remove(dummy_path)
-            logger.info(f"Deleted dummy file for movie {movie.get('title')}", extra={'emoji_type': 'delete'})
+            forget_placeholder_dirs(os.path.dirname(dummy_path))
+            logger.info(f"Deleted dummy file for movie {movie.get('title')}", extra=LOG_EXTRA['delete'])
         else:
-            logger.info(f"No dummy file exists for movie {movie.get('title')}", extra={'emoji_type': 'info'})
-        folder = os.path.join(settings.MOVIE_LIBRARY_FOLDER,
-                              f"{sanitize_filename(movie.get('title', ''))}{' ('+str(movie.get('year'))+')' if movie.get('year') else ''} {{tmdb-{tmdb_id}}}")
-        refresh_url = build_plex_url(f"library/sections/{settings.PLEX_MOVIE_SECTION_ID}/refresh")
-        r = requests.get(refresh_url, headers={'X-Plex-Token': settings.PLEX_TOKEN})
-        r.raise_for_status()
+            logger.info(f"No dummy file exists for movie {movie.get('title')}", extra=LOG_EXTRA['info'])
+        refresh_plex_section(settings.PLEX_MOVIE_SECTION_ID)
     return JSONResponse({"status": "success", "message": "MovieDelete processed"})
 
 def handle_movieadd(data: dict):
@@ -223,30 +208,29 @@ def handle_movieadd(data: dict):
         movie = data.get('movie', {})
         tmdb_id = movie.get('tmdbId') or data.get('remoteMovie', {}).get('tmdbId')
         if not tmdb_id:
-            logger.error("Missing TMDB ID for movie add", extra={'emoji_type': 'error'})
+            logger.error("Missing TMDB ID for movie add", extra=LOG_EXTRA['error'])
             return JSONResponse({"status": "error"}, status_code=400)
         title = movie.get('title', 'Unknown Movie')
         year = movie.get('year', '')
         dummy_path = place_dummy_file("movie", title, year, tmdb_id, settings.MOVIE_LIBRARY_FOLDER)
-        logger.info(f"Created dummy file for movie '{title}' at {dummy_path}", extra={'emoji_type': 'dummy'})
-        refresh_url = build_plex_url(f"library/sections/{settings.PLEX_MOVIE_SECTION_ID}/refresh")
-        r = requests.get(refresh_url, headers={'X-Plex-Token': settings.PLEX_TOKEN})
-        r.raise_for_status()
-        schedule_movie_request_update(title, tmdb_id, delay=10, retries=5)
+        logger.info(f"Created dummy file for movie '{title}' at {dummy_path}", extra=LOG_EXTRA['dummy'])
+        refresh_plex_section(settings.PLEX_MOVIE_SECTION_ID)
+        schedule_movie_request_update(title, tmdb_id, delay=10, retries=5, year=year)
     return JSONResponse({"status": "success", "message": "MovieAdd processed"})
 
 def handle_seriesdelete(data: dict):
     if 'series' in data:
         series = data.get('series', {})
+        if series.get('tvdbId'):
+            # A re-added series gets a new Sonarr id; don't let monitors keep using the old one
+            forget_sonarr_series(series['tvdbId'])
         series_folder = os.path.join(settings.TV_LIBRARY_FOLDER,
                                      f"{sanitize_filename(series.get('title',''))}{' ('+str(series.get('year'))+')' if series.get('year') else ''} {{tvdb-{series.get('tvdbId')}}}")
         if os.path.exists(series_folder):
-            import shutil
             shutil.rmtree(series_folder)
-            logger.info(f"Deleted series folder for {series.get('title')}", extra={'emoji_type': 'delete'})
-        refresh_url = build_plex_url(f"library/sections/{settings.PLEX_TV_SECTION_ID}/refresh")
-        r = requests.get(refresh_url, headers={'X-Plex-Token': settings.PLEX_TOKEN})
-        r.raise_for_status()
+            forget_placeholder_dirs(series_folder)
+            logger.info(f"Deleted series folder for {series.get('title')}", extra=LOG_EXTRA['delete'])
+        refresh_plex_section(settings.PLEX_TV_SECTION_ID)
     return JSONResponse({"status": "success", "message": "SeriesDelete processed"})
 
 def handle_playback(data: dict):
@@ -256,6 +240,14 @@ def handle_playback(data: dict):
         is_4k = is_4k_request(file_path)
         title = media.get("title", "Unknown Title")
         rating_key = media.get("ids", {}).get("plex")
+        if rating_key is not None:
+            # One canonical, interned str per item: payloads may carry the key as int or str,
+            # and it keys every per-item dict in the integrations module
+            rating_key = sys.intern(str(rating_key))
+
+        if is_monitored(rating_key):
+            # Search again; the new monitor replaces (and cancels) the running one
+            logger.info(f"Already monitoring '{title}', restarting its search", extra=LOG_EXTRA['info'])
 
         if media.get("type") == "movie":
             tmdb_id = media.get("ids", {}).get("tmdb")
@@ -265,12 +257,12 @@ def handle_playback(data: dict):
                 m = re.search(r"\{tmdb-(\d+)\}", file_path)
                 if m:
                     tmdb_id = m.group(1)
-                    logger.info(f"Extracted numeric TMDB ID: {tmdb_id} from file path", extra={'emoji_type': 'info'})
+                    logger.info(f"Extracted numeric TMDB ID: {tmdb_id} from file path", extra=LOG_EXTRA['info'])
                 else:
-                    logger.error("TMDB ID not found in file path", extra={'emoji_type': 'error'})
+                    logger.error("TMDB ID not found in file path", extra=LOG_EXTRA['error'])
                     return JSONResponse({"status": "error", "message": "Missing valid TMDB ID"}, status_code=400)
             base_title = strip_movie_status(sanitize_filename(title))
-            logger.info(f"Processing movie playback for {base_title}", extra={'emoji_type': 'processing'})
+            logger.info(f"Processing movie playback for {base_title}", extra=LOG_EXTRA['processing'])
             success = search_in_radarr(tmdb_id, rating_key, is_4k=is_4k)
             if not success:
                 return JSONResponse({"status": "error", "message": "Search failed"}, status_code=500)
@@ -281,7 +273,7 @@ def handle_playback(data: dict):
                 rating_key=rating_key,
                 media_type='movie',
                 attempts=0,
-                start_time=time.time(),
+                start_time=time.monotonic(),
                 is_4k=is_4k
             )
             return JSONResponse({"status": "success"})
@@ -293,9 +285,9 @@ def handle_playback(data: dict):
             id_match = re.search(r"\[ID:(\d+)\]", file_path)
             if id_match:
                 episode_id = id_match.group(1)
-                logger.info(f"Found episode ID: {episode_id} in filename", extra={'emoji_type': 'info'})
+                logger.info(f"Found episode ID: {episode_id} in filename", extra=LOG_EXTRA['info'])
             else:
-                logger.error("Episode ID not found in filename", extra={'emoji_type': 'error'})
+                logger.error("Episode ID not found in filename", extra=LOG_EXTRA['error'])
                 return JSONResponse({"status": "error", "message": "Episode ID not found"}, status_code=400)
 
             # Handle variable substitution issues from Tautulli
@@ -319,7 +311,7 @@ def handle_playback(data: dict):
                 season_number = int(media.get("season_num", 0))
                 episode_number = int(media.get("episode_num", 0))
             except (ValueError, TypeError):
-                logger.error("Invalid season or episode number format", extra={'emoji_type': 'error'})
+                logger.error("Invalid season or episode number format", extra=LOG_EXTRA['error'])
                 return JSONResponse({"status": "error", "message": "Invalid season/episode format"}, status_code=400)
                 
             tvdb_id = media.get("ids", {}).get("tvdb")
@@ -335,7 +327,7 @@ def handle_playback(data: dict):
                     
             # Format full episode identifier for logging and tracking
             full_title = f"{series_title} - S{season_number:02d}E{episode_number:02d} - {episode_title}"
-            logger.info(f"Processing episode playback for {full_title}", extra={'emoji_type': 'processing'})
+            logger.info(f"Processing episode playback for {full_title}", extra=LOG_EXTRA['processing'])
 
             # Continue with existing search code...
             series_id = search_in_sonarr(tvdb_id, rating_key, episode_mode=True, is_4k=is_4k)
@@ -362,16 +354,15 @@ def handle_playback(data: dict):
                 attempts=0,
                 season_number=season_number,
                 episode_number=episode_number,
-                start_time=time.time(),
+                start_time=time.monotonic(),
                 is_4k=is_4k
             )
             return JSONResponse({"status": "success"})
 
         else:
-            logger.warning(f"Unsupported media type {media.get('type')}", extra={'emoji_type': 'warning'})
+            logger.warning(f"Unsupported media type {media.get('type')}", extra=LOG_EXTRA['warning'])
             return JSONResponse({"status": "error", "message": "Unsupported media type"}, status_code=400)
 
     except Exception as e:
-        logger.error(f"Playback handling error: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Playback handling error: {e}", extra=LOG_EXTRA['error'])
         return JSONResponse({"status": "error", "message": str(e)}, status_code=500)
-import os, re, threading, time, shutil, requests
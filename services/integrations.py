@@ -1,20 +1,122 @@
-import os, glob, shutil, time, threading, requests, subprocess, platform
+import os, glob, shutil, time, threading, itertools, requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from plexapi.exceptions import NotFound
 from core.config import settings
-from core.logger import logger
+from core.logger import logger, LOG_EXTRA
+from core.scheduler import scheduler
 from services.utils import (
-    sanitize_filename, strip_status_markers, get_series_folder,
-    get_arr_config
+    sanitize_filename, strip_status_markers, get_arr_config
 )
-from services.plex_client import plex
+from services.plex_client import get_plex, find_show_by_id, find_movie_by_id
 
 # Global variables
-BASE_TITLES = {}
-PROGRESS_FLAGS = {}
 TIMER_LOCK = threading.Lock()
 ACTIVE_SEARCH_TIMERS = {}
-LAST_RADARR_SEARCH = {}
+MONITOR_GENERATIONS = {}  # rating_key -> generation of the monitor chain allowed to reschedule or end it
+MONITOR_GENERATION_COUNTER = itertools.count(1)
+LAST_RADARR_SEARCH = {}  # rating_key -> monotonic time of the last manual Radarr search
+RADARR_SEARCH_LOCK = threading.Lock()  # Guards LAST_RADARR_SEARCH only; TIMER_LOCK guards the monitors
+RADARR_SEARCH_COOLDOWN = 30  # Seconds before the same item may trigger another Radarr search
+QUEUE_CACHE = {}  # (arr url) -> (fetched_at, {media id: download percent})
+QUEUE_CACHE_TTL = 2  # Seconds a queue snapshot is shared between monitors
+QUEUE_FETCH_LOCKS = {}  # (arr url) -> lock held while that queue is being fetched
+QUEUE_PAGE_SIZE = 1000
+SERIES_CACHE = {}  # (sonarr url, tvdb id) -> SeriesRef
+EPISODE_CACHE = {}  # (sonarr url, series id, season or None) -> (fetched_at, episode list)
+EPISODE_CACHE_TTL = 2  # Seconds an episode list is shared between monitors of the same series
+PROGRESS_STEP = 5  # Download percentage granularity shown in Plex titles
+REQUEST_RETRY_DELAY = 3  # Seconds between attempts to find a newly added item in Plex
+# Status suffixes appended to Plex titles; progress only ever shows PROGRESS_STEP multiples
+STATUS_REQUEST = " - [Request]"
+STATUS_SEARCHING = " - Searching..."
+STATUS_RETRYING = " - Retrying..."
+STATUS_AVAILABLE = " - Available"
+STATUS_NOT_FOUND = " - Not Found"
+STATUS_NOT_AVAILABLE = " - Not Available"
+STATUS_DOWNLOADING = tuple(f" - Downloading {pct}%" for pct in range(0, 101, PROGRESS_STEP))
+PROGRESS_UPDATE_INTERVAL = 15  # Minimum seconds between progress title edits for one item
+MONITOR_STATE = {}  # rating_key -> MonitorState
+PLACEHOLDER_DIRS = set()  # folders place_dummy_file has already made sure exist
+PLACEHOLDER_DIRS_MAX = 4096  # PLACEHOLDER_DIRS is cleared when it reaches this size
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fetch")  # Overlaps a poll's independent requests
+REQUEST_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="request")  # Runs delayed request-title edits
+
+# Keep-alive session per Radarr/Sonarr instance with its API key preset; failed connections are retried
+ARR_SESSIONS = {}  # (arr url) -> requests.Session
+# (connect, read) seconds; read timeouts are not retried, so a hung *arr costs one read timeout per call
+ARR_TIMEOUT = (3.05, 30)
+ARR_MAX_CONNECTIONS = 8  # Concurrent requests allowed to one *arr instance
+
+def arr_session(url, api_key):
+    """Return the shared session for one *arr instance, creating it on first use"""
+    session = ARR_SESSIONS.get(url)
+    if session is None:
+        session = requests.Session()
+        session.headers['X-Api-Key'] = api_key
+        # pool_block makes callers wait for one of ARR_MAX_CONNECTIONS sockets instead of opening
+        # (and then discarding) extra ones, so bursts of webhooks and polls can't flood the *arr
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=ARR_MAX_CONNECTIONS, pool_block=True,
+                              max_retries=Retry(total=2, read=0, backoff_factor=0.3))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        # Two threads may race on first use; keep whichever session landed first
+        session = ARR_SESSIONS.setdefault(url, session)
+    return session
+
+class SeriesRef:
+    """The fields monitors use from a Sonarr series; caching the whole JSON would pin its seasons and images"""
+    __slots__ = ('id', 'year')
+
+    def __init__(self, series):
+        self.id = series['id']
+        self.year = series.get('year')
+
+class MonitorState:
+    """Everything a running monitor remembers about one item between polls"""
+    __slots__ = ('downloading', 'retrying', 'last_progress_update', 'item', 'title', 'base', 'display_title')
+
+    def __init__(self):
+        self.downloading = False  # a queue item has been seen
+        self.retrying = False  # the queue item vanished and a new search was started
+        self.last_progress_update = 0  # monotonic time of the last progress title edit
+        self.item = None  # Plex item, fetched once per monitor
+        self.title = None  # title last read from or written to Plex
+        self.base = None  # title without status markers; our edits only ever change the suffix
+        self.display_title = None  # name used in log messages, formatted on first use
 
 # Dummy File Management
+def ensure_placeholder_dir(path):
+    """makedirs each placeholder folder once; a series add would otherwise repeat it for every episode"""
+    if path not in PLACEHOLDER_DIRS:
+        os.makedirs(path, exist_ok=True)
+        if len(PLACEHOLDER_DIRS) >= PLACEHOLDER_DIRS_MAX:
+            PLACEHOLDER_DIRS.clear()
+        PLACEHOLDER_DIRS.add(path)
+
+def forget_placeholder_dirs(root):
+    """Drop root and its subfolders from PLACEHOLDER_DIRS after the tree has been deleted"""
+    prefix = os.path.join(root, '')
+    PLACEHOLDER_DIRS.difference_update([path for path in list(PLACEHOLDER_DIRS)
+                                        if path == root or path.startswith(prefix)])
+
+def _write_dummy_file(target_path):
+    if settings.PLACEHOLDER_STRATEGY == 'copy':
+        # copyfile copies in the kernel (sendfile) and skips copy()'s extra chmod of the dummy's mode
+        shutil.copyfile(settings.DUMMY_FILE_PATH, target_path)
+        logger.debug(f"Dummy file copied to: {target_path}", extra=LOG_EXTRA['debug'])
+    else:  # 'hardlink' strategy (default)
+        try:
+            os.link(settings.DUMMY_FILE_PATH, target_path)
+            logger.debug(f"Dummy file hardlinked to: {target_path}", extra=LOG_EXTRA['debug'])
+        except FileNotFoundError:  # missing folder or dummy; a copy would fail the same way
+            raise
+        except OSError:
+            logger.warning("Hardlink failed, falling back to copy", extra=LOG_EXTRA['warning'])
+            shutil.copyfile(settings.DUMMY_FILE_PATH, target_path)
+            logger.debug(f"Dummy file copied to: {target_path} (fallback)", extra=LOG_EXTRA['debug'])
+
 def place_dummy_file(media_type, title, year, media_id, target_base_folder, season_number=None, episode_range=None, episode_id=None):
     clean_title = sanitize_filename(title)
     year_str = f" ({year})" if year else ''
@@ -30,30 +132,28 @@ def place_dummy_file(media_type, title, year, media_id, target_base_folder, seas
             if episode_id:
                 file_name = f"{clean_title} - s{int(season_number):02d}e{int(episode_range[0]):02d} (dummy) [ID:{episode_id}].mp4"
             else:
-                logger.warning(f"Episode ID not provided for {title} S{season_number:02d}E{episode_range[0]:02d}", extra={'emoji_type': 'warning'})
+                logger.warning(f"Episode ID not provided for {title} S{season_number:02d}E{episode_range[0]:02d}", extra=LOG_EXTRA['warning'])
                 file_name = f"{clean_title} - s{int(season_number):02d}e{int(episode_range[0]):02d} (dummy) [ID:unknown].mp4"
         else:
             ep_range = f"e{episode_range[0]:02d}-e{episode_range[1]:02d}" if episode_range else "e01-e99"
             file_name = f"{clean_title} - s{int(season_number):02d}{ep_range} (dummy).mp4"
-    os.makedirs(target_dir, exist_ok=True)
+    ensure_placeholder_dir(target_dir)
     target_path = os.path.join(target_dir, file_name)
-    if os.path.exists(target_path):
+    # Replace any previous placeholder; asking forgiveness saves a stat per file on bulk adds
+    try:
         os.remove(target_path)
+    except FileNotFoundError:
+        pass
 
     try:
-        if settings.PLACEHOLDER_STRATEGY == 'copy':
-            shutil.copy(settings.DUMMY_FILE_PATH, target_path)
-            logger.debug(f"Dummy file copied to: {target_path}", extra={'emoji_type': 'debug'})
-        else:  # 'hardlink' strategy (default)
-            try:
-                os.link(settings.DUMMY_FILE_PATH, target_path)
-                logger.debug(f"Dummy file hardlinked to: {target_path}", extra={'emoji_type': 'debug'})
-            except OSError:
-                logger.warning("Hardlink failed, falling back to copy", extra={'emoji_type': 'warning'})
-                shutil.copy(settings.DUMMY_FILE_PATH, target_path)
-                logger.debug(f"Dummy file copied to: {target_path} (fallback)", extra={'emoji_type': 'debug'})
+        try:
+            _write_dummy_file(target_path)
+        except FileNotFoundError:
+            # The folder was removed since we created it (a series delete, or the *arr cleaning up); recreate it once
+            os.makedirs(target_dir, exist_ok=True)
+            _write_dummy_file(target_path)
     except Exception as e:
-        logger.error(f"Failed to create dummy file: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Failed to create dummy file: {e}", extra=LOG_EXTRA['error'])
         raise
 
     return target_path
@@ -69,24 +169,26 @@ def delete_dummy_files(media_type, title, year, media_id, target_base_folder, se
         clean_title = sanitize_filename(strip_status_markers(title))
         year_str = f" ({year})" if year else ''
         
-        logger.debug(f"Cleaning up placeholders for {clean_title}{year_str}", extra={'emoji_type': 'debug'})
+        logger.debug(f"Cleaning up placeholders for {clean_title}{year_str}", extra=LOG_EXTRA['debug'])
         
         if media_type == 'movie':
-            # For movies, use glob patterns to find potential dummy files directly
-            patterns = [
+            # For movies, use glob patterns to find potential dummy files directly. The
+            # {edition-Dummy} folders already match the first pattern, and without a year the
+            # two patterns are the same, so dedupe them rather than scan the library twice
+            patterns = dict.fromkeys((
                 os.path.join(target_base_folder, f"{clean_title}{year_str} {{tmdb-{media_id}}}*", "*dummy*.mp4"),
-                os.path.join(target_base_folder, f"{clean_title}{year_str} {{tmdb-{media_id}}}{{edition-Dummy}}*", "*dummy*.mp4"),
                 os.path.join(target_base_folder, f"{clean_title} {{tmdb-{media_id}}}*", "*dummy*.mp4")
-            ]
+            ))
             
             # Find and delete any matching dummy files
             for pattern in patterns:
                 for dummy_file in glob.glob(pattern):
                     try:
                         os.remove(dummy_file)
-                        logger.info(f"Deleted movie placeholder: {dummy_file}", extra={'emoji_type': 'delete'})
+                        logger.info(f"Deleted movie placeholder: {dummy_file}", extra=LOG_EXTRA['delete'])
+                        PLACEHOLDER_DIRS.discard(os.path.dirname(dummy_file))
                     except Exception as e:
-                        logger.error(f"Failed to delete {dummy_file}: {e}", extra={'emoji_type': 'error'})
+                        logger.error(f"Failed to delete {dummy_file}: {e}", extra=LOG_EXTRA['error'])
         
         else:  # TV show
             # For TV episodes, construct pattern directly to the potential dummy file
@@ -101,80 +203,121 @@ def delete_dummy_files(media_type, title, year, media_id, target_base_folder, se
             for dummy_file in glob.glob(pattern):
                 try:
                     os.remove(dummy_file)
-                    logger.info(f"Deleted episode placeholder: {dummy_file}", extra={'emoji_type': 'delete'})
+                    logger.info(f"Deleted episode placeholder: {dummy_file}", extra=LOG_EXTRA['delete'])
+                    PLACEHOLDER_DIRS.discard(os.path.dirname(dummy_file))
                 except Exception as e:
-                    logger.error(f"Failed to delete {dummy_file}: {e}", extra={'emoji_type': 'error'})
+                    logger.error(f"Failed to delete {dummy_file}: {e}", extra=LOG_EXTRA['error'])
                     
     except Exception as e:
-        logger.error(f"Error deleting placeholder files: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Error deleting placeholder files: {e}", extra=LOG_EXTRA['error'])
 
 # Title update and scheduling functions
-def schedule_episode_request_update(series_title, season_num, episode_num, media_id, delay=10, retries=5):
-    def attempt_update(attempt=1):
-        try:
-            tv_section = plex.library.sectionByID(settings.PLEX_TV_SECTION_ID)
-            show = tv_section.get(series_title)
-            if not show:
-                logger.debug(f"Show '{series_title}' not found on attempt {attempt}.", extra={'emoji_type': 'debug'})
-                if attempt < retries:
-                    threading.Timer(3, attempt_update, args=[attempt+1]).start()
-                return
+def mark_requested(item):
+    """Give a Plex item the [Request] marker, skipping the edit if it already has it; returns the new title"""
+    new_title = strip_status_markers(item.title) + STATUS_REQUEST
+    if item.title != new_title:
+        item.editTitle(new_title)
+    return new_title
+
+def run_or_schedule(delay, func, *args):
+    """Call func(*args) on the caller when there is nothing to wait for, otherwise on REQUEST_EXECUTOR after delay"""
+    if delay <= 0:
+        func(*args)
+    else:
+        # The scheduler thread only hands the call over, so title edits never hold up monitor polls
+        scheduler.schedule(delay, REQUEST_EXECUTOR.submit, func, *args)
 
-            episodes = show.episodes()
-            target_ep = next((ep for ep in episodes if int(ep.index) == int(episode_num)), None)
-            if target_ep:
-                base = strip_status_markers(target_ep.title)
-                new_title = f"{base} - [Request]"
-                target_ep.editTitle(new_title)
-                target_ep.reload()
+def update_episode_request_titles(series_title, episodes, media_id, attempt=1, retries=5):
+    """Mark a show's (season, episode) pairs as requested, finding the show once for the whole batch"""
+    try:
+        show = find_show_by_id(media_id)
+        if not show:
+            tv_section = get_plex().library.sectionByID(settings.PLEX_TV_SECTION_ID)
+            try:
+                show = tv_section.get(series_title)
+            except NotFound:  # not scanned yet; retried below
+                show = None
+        if not show:
+            logger.debug(f"Show '{series_title}' not found on attempt {attempt}.", extra=LOG_EXTRA['debug'])
+            if attempt < retries:
+                run_or_schedule(REQUEST_RETRY_DELAY, update_episode_request_titles, series_title, episodes,
+                                media_id, attempt+1, retries)
+            return
+
+        # show.episode() lists every episode of the show to find one, so list them once for the batch
+        plex_episodes = {(ep.parentIndex, ep.index): ep for ep in show.episodes()}
+        missing = []
+        for season_num, episode_num in episodes:
+            target_ep = plex_episodes.get((int(season_num), int(episode_num)))
+            if not target_ep:
+                missing.append((season_num, episode_num))
+                continue
+            try:
+                new_title = mark_requested(target_ep)
                 logger.info(f"Updated episode title for '{series_title}' S{season_num:02d}E{episode_num:02d} to: {new_title}",
-                            extra={'emoji_type': 'update'})
-                series_folder = get_series_folder("tv", settings.TV_LIBRARY_FOLDER, series_title, show.year, media_id)
-                # persist rating key as needed...
-            else:
-                if attempt < retries:
-                    logger.debug(f"Episode {episode_num} not found in '{series_title}' (attempt {attempt}). Retrying...", extra={'emoji_type': 'debug'})
-                    threading.Timer(3, attempt_update, args=[attempt+1]).start()
-        except Exception as e:
-            logger.error(f"Failed to update '{series_title}' S{season_num:02d}E{episode_num:02d}: {e}", extra={'emoji_type': 'error'})
+                            extra=LOG_EXTRA['update'])
+            except Exception as e:
+                logger.error(f"Failed to update '{series_title}' S{season_num:02d}E{episode_num:02d}: {e}", extra=LOG_EXTRA['error'])
+        if missing and attempt < retries:
+            logger.debug(f"{len(missing)} episode(s) not found in '{series_title}' (attempt {attempt}). Retrying...", extra=LOG_EXTRA['debug'])
+            run_or_schedule(REQUEST_RETRY_DELAY, update_episode_request_titles, series_title, missing,
+                            media_id, attempt+1, retries)
+    except Exception as e:
+        logger.error(f"Failed to update episodes of '{series_title}': {e}", extra=LOG_EXTRA['error'])
 
-    threading.Timer(delay, attempt_update).start()
+def schedule_episode_request_update(series_title, episodes, media_id, delay=10, retries=5):
+    run_or_schedule(delay, update_episode_request_titles, series_title, list(episodes), media_id, 1, retries)
 
-def schedule_movie_request_update(movie_title, media_id, delay=10, retries=5):
-    def attempt_update(attempt=1):
-        try:
-            movie_section = plex.library.sectionByID(settings.PLEX_MOVIE_SECTION_ID)
-            item = movie_section.get(movie_title)
-            if item:
-                base = strip_status_markers(item.title)
-                new_title = f"{base} - [Request]"
-                item.editTitle(new_title)
-                item.reload()
-                logger.info(f"Updated movie title for '{movie_title}' to: {new_title}", extra={'emoji_type': 'update'})
-                series_folder = get_series_folder("movie", settings.MOVIE_LIBRARY_FOLDER, movie_title, item.year, media_id)
-                # persist rating key as needed...
-            else:
-                if attempt < retries:
-                    logger.debug(f"Movie '{movie_title}' not found (attempt {attempt}). Retrying...", extra={'emoji_type': 'debug'})
-                    threading.Timer(3, attempt_update, args=[attempt+1]).start()
-        except Exception as e:
-            logger.error(f"Failed to update movie '{movie_title}': {e}", extra={'emoji_type': 'error'})
+def update_movie_request_title(movie_title, media_id, year=None, attempt=1, retries=5):
+    try:
+        item = find_movie_by_id(media_id, movie_title, year)
+        if not item:
+            movie_section = get_plex().library.sectionByID(settings.PLEX_MOVIE_SECTION_ID)
+            try:
+                item = movie_section.get(movie_title)
+            except NotFound:  # not scanned yet; retried below
+                item = None
+        if item:
+            new_title = mark_requested(item)
+            logger.info(f"Updated movie title for '{movie_title}' to: {new_title}", extra=LOG_EXTRA['update'])
+        else:
+            if attempt < retries:
+                logger.debug(f"Movie '{movie_title}' not found (attempt {attempt}). Retrying...", extra=LOG_EXTRA['debug'])
+                run_or_schedule(REQUEST_RETRY_DELAY, update_movie_request_title, movie_title, media_id, year,
+                                attempt+1, retries)
+    except Exception as e:
+        logger.error(f"Failed to update movie '{movie_title}': {e}", extra=LOG_EXTRA['error'])
 
-    threading.Timer(delay, attempt_update).start()
+def schedule_movie_request_update(movie_title, media_id, delay=10, retries=5, year=None):
+    run_or_schedule(delay, update_movie_request_title, movie_title, media_id, year, 1, retries)
 
 # Radarr integration functions
 def trigger_radarr_search(movie_id, movie_title=None):
     try:
-        response = requests.post(f"{settings.RADARR_URL}/command", json={'name': 'MoviesSearch', 'movieIds': [movie_id]}, headers={'X-Api-Key': settings.RADARR_API_KEY})
+        response = arr_session(settings.RADARR_URL, settings.RADARR_API_KEY).post(f"{settings.RADARR_URL}/command", json={'name': 'MoviesSearch', 'movieIds': [movie_id]}, timeout=ARR_TIMEOUT)
         response.raise_for_status()
-        logger.debug(f"Radarr search triggered for movie id {movie_id}", extra={'emoji_type': 'debug'})
+        logger.debug(f"Radarr search triggered for movie id {movie_id}", extra=LOG_EXTRA['debug'])
         if movie_title:
-            logger.info(f"Triggered search for {movie_title}", extra={'emoji_type': 'search'})
+            logger.info(f"Triggered search for {movie_title}", extra=LOG_EXTRA['search'])
         return True
     except Exception as e:
-        logger.error(f"Radarr search failed: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Radarr search failed: {e}", extra=LOG_EXTRA['error'])
         return False
 
+def claim_radarr_search(rating_key):
+    """Atomically record a manual search for rating_key; False if one ran within RADARR_SEARCH_COOLDOWN"""
+    now = time.monotonic()
+    with RADARR_SEARCH_LOCK:
+        # No 0 default: the monotonic clock starts near zero at boot
+        last = LAST_RADARR_SEARCH.get(rating_key)
+        if last is not None and now - last < RADARR_SEARCH_COOLDOWN:
+            return False
+        # Expired entries no longer block anything; drop them so the dict only holds recent searches
+        for key in [k for k, t in LAST_RADARR_SEARCH.items() if now - t >= RADARR_SEARCH_COOLDOWN]:
+            del LAST_RADARR_SEARCH[key]
+        LAST_RADARR_SEARCH[rating_key] = now
+    return True
+
 def search_in_radarr(tmdb_id, rating_key, is_4k=False):
     """Search for a movie in Radarr"""
     config = get_arr_config('movie', is_4k)
@@ -182,35 +325,34 @@ def search_in_radarr(tmdb_id, rating_key, is_4k=False):
     try:
         tmdb_id_int = int(tmdb_id)
     except (ValueError, TypeError):
-        logger.error(f"Invalid TMDB ID received: {tmdb_id}", extra={'emoji_type': 'error'})
+        logger.error(f"Invalid TMDB ID received: {tmdb_id}", extra=LOG_EXTRA['error'])
         return False
     try:
-        movies_response = requests.get(f"{config['url']}/movie", headers={'X-Api-Key': config['api_key']})
+        # Filter server-side rather than downloading and decoding the whole library
+        movies_response = arr_session(config['url'], config['api_key']).get(f"{config['url']}/movie", params={'tmdbId': tmdb_id_int}, timeout=ARR_TIMEOUT)
         movies_response.raise_for_status()
         movies = movies_response.json()
         if not isinstance(movies, list):
-            logger.error(f"Expected list from Radarr /movie endpoint but got {type(movies)}", extra={'emoji_type': 'error'})
+            logger.error(f"Expected list from Radarr /movie endpoint but got {type(movies)}", extra=LOG_EXTRA['error'])
             return False
         
-        existing = [m for m in movies if int(m.get("tmdbId", 0)) == tmdb_id_int]
-        if existing:
-            movie_data = existing[0]
-            logger.info(f"Movie already exists in Radarr: {movie_data['title']}", extra={'emoji_type': 'info'})
+        # Only the first match is used, so stop at it instead of building the full match list
+        movie_data = next((m for m in movies if m.get("tmdbId") == tmdb_id_int), None)
+        if movie_data:
+            logger.info(f"Movie already exists in Radarr: {movie_data['title']}", extra=LOG_EXTRA['info'])
             if not movie_data.get("monitored", False):
                 movie_data["monitored"] = True
-                put_response = requests.put(f"{config['url']}/movie/{movie_data['id']}", json=movie_data, headers={'X-Api-Key': config['api_key']})
+                put_response = arr_session(config['url'], config['api_key']).put(f"{config['url']}/movie/{movie_data['id']}", json=movie_data, timeout=ARR_TIMEOUT)
                 put_response.raise_for_status()
-                logger.info(f"Movie {movie_data['title']} marked as monitored", extra={'emoji_type': 'monitored'})
-            now = time.time()
-            if rating_key not in LAST_RADARR_SEARCH or (now - LAST_RADARR_SEARCH[rating_key] >= 30):
-                LAST_RADARR_SEARCH[rating_key] = now
+                logger.info(f"Movie {movie_data['title']} marked as monitored", extra=LOG_EXTRA['monitored'])
+            if claim_radarr_search(rating_key):
                 trigger_radarr_search(movie_data['id'], movie_data['title'])
             else:
-                logger.debug("Manual search already triggered recently; skipping duplicate search", extra={'emoji_type': 'debug'})
+                logger.debug("Manual search already triggered recently; skipping duplicate search", extra=LOG_EXTRA['debug'])
             # Do not schedule further timer retries if TMDB ID is invalid
             return True
 
-        lookup = requests.get(f"{config['url']}/movie/lookup", params={'term': f"tmdb:{tmdb_id_int}"}, headers={'X-Api-Key': config['api_key']})
+        lookup = arr_session(config['url'], config['api_key']).get(f"{config['url']}/movie/lookup", params={'term': f"tmdb:{tmdb_id_int}"}, timeout=ARR_TIMEOUT)
         lookup.raise_for_status()
         movie_data = lookup.json()[0]
         payload = {
@@ -226,19 +368,17 @@ def search_in_radarr(tmdb_id, rating_key, is_4k=False):
                 'monitor': 'movieOnly'
             }
         }
-        response = requests.post(f"{config['url']}/movie", json=payload, headers={'X-Api-Key': config['api_key']})
+        response = arr_session(config['url'], config['api_key']).post(f"{config['url']}/movie", json=payload, timeout=ARR_TIMEOUT)
         response.raise_for_status()
-        logger.info(f"Added movie: {movie_data['title']}", extra={'emoji_type': 'success'})
-        now = time.time()
-        if rating_key not in LAST_RADARR_SEARCH or (now - LAST_RADARR_SEARCH[rating_key] >= 30):
-            LAST_RADARR_SEARCH[rating_key] = now
+        logger.info(f"Added movie: {movie_data['title']}", extra=LOG_EXTRA['success'])
+        if claim_radarr_search(rating_key):
             trigger_radarr_search(response.json()['id'], movie_data['title'])
         else:
-            logger.debug("Manual search already triggered recently; skipping duplicate search", extra={'emoji_type': 'debug'})
+            logger.debug("Manual search already triggered recently; skipping duplicate search", extra=LOG_EXTRA['debug'])
         return True
 
     except Exception as e:
-        logger.error(f"Radarr operation failed: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Radarr operation failed: {e}", extra=LOG_EXTRA['error'])
         return False
 
 # Sonarr integration functions would follow a similar pattern.
@@ -247,27 +387,27 @@ def search_in_sonarr(tvdb_id, rating_key, episode_mode=False, is_4k=False):
     try:
         config = get_arr_config('tv', is_4k)
         # First check if series exists
-        existing_response = requests.get(
+        existing_response = arr_session(config['url'], config['api_key']).get(
             f"{config['url']}/series", 
             params={'tvdbId': tvdb_id}, 
-            headers={'X-Api-Key': config['api_key']}
+            timeout=ARR_TIMEOUT
         )
         existing_response.raise_for_status()
         
         if existing_response.status_code == 200 and existing_response.json():
             series = existing_response.json()[0]
-            logger.info(f"Series already exists in Sonarr: {series['title']}", extra={'emoji_type': 'info'})
+            logger.info(f"Series already exists in Sonarr: {series['title']}", extra=LOG_EXTRA['info'])
             
             # Always update monitored status
             if not series.get("monitored", False):
                 series["monitored"] = True
-                update_response = requests.put(
+                update_response = arr_session(config['url'], config['api_key']).put(
                     f"{config['url']}/series/{series['id']}", 
                     json=series,
-                    headers={'X-Api-Key': config['api_key']}
+                    timeout=ARR_TIMEOUT
                 )
                 update_response.raise_for_status()
-                logger.info(f"Series {series['title']} marked as monitored", extra={'emoji_type': 'monitored'})
+                logger.info(f"Series {series['title']} marked as monitored", extra=LOG_EXTRA['monitored'])
             
             # In episode mode, just return the series ID, don't trigger search
             if episode_mode:
@@ -278,10 +418,10 @@ def search_in_sonarr(tvdb_id, rating_key, episode_mode=False, is_4k=False):
             return series['id']
         
         # If series doesn't exist, look it up and add it
-        lookup_response = requests.get(
+        lookup_response = arr_session(config['url'], config['api_key']).get(
             f"{config['url']}/series/lookup", 
             params={'term': f"tvdb:{tvdb_id}"},
-            headers={'X-Api-Key': config['api_key']}
+            timeout=ARR_TIMEOUT
         )
         lookup_response.raise_for_status()
         series_data = lookup_response.json()[0]
@@ -306,14 +446,14 @@ def search_in_sonarr(tvdb_id, rating_key, episode_mode=False, is_4k=False):
                     'monitored': True
                 })
         
-        add_response = requests.post(
+        add_response = arr_session(config['url'], config['api_key']).post(
             f"{config['url']}/series",
             json=payload,
-            headers={'X-Api-Key': config['api_key']}
+            timeout=ARR_TIMEOUT
         )
         add_response.raise_for_status()
         added_series = add_response.json()
-        logger.info(f"Added series: {series_data['title']}", extra={'emoji_type': 'success'})
+        logger.info(f"Added series: {series_data['title']}", extra=LOG_EXTRA['success'])
         
         if not episode_mode:
             trigger_sonarr_search(added_series['id'], added_series['title'])
@@ -321,7 +461,7 @@ def search_in_sonarr(tvdb_id, rating_key, episode_mode=False, is_4k=False):
         return added_series['id']
         
     except Exception as e:
-        logger.error(f"Sonarr operation failed: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Sonarr operation failed: {e}", extra=LOG_EXTRA['error'])
         return None
 
 def trigger_sonarr_search(series_id, season_number=None, episode_ids=None, series_title=None, is_4k=False):
@@ -335,203 +475,352 @@ def trigger_sonarr_search(series_id, season_number=None, episode_ids=None, serie
             'episodeIds': [int(episode_ids)] if isinstance(episode_ids, str) else episode_ids
         }
 
-        response = requests.post(
+        response = arr_session(config['url'], config['api_key']).post(
             f"{config['url']}/command",
             json=command,
-            headers={'X-Api-Key': config['api_key']}
+            timeout=ARR_TIMEOUT
         )
         response.raise_for_status()
         logger.info(f"Triggered episode search for {series_title or f'series {series_id}'}", 
-                   extra={'emoji_type': 'search'})
+                   extra=LOG_EXTRA['search'])
         return True
     except Exception as e:
-        logger.error(f"Sonarr search failed: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Sonarr search failed: {e}", extra=LOG_EXTRA['error'])
         return False
 
 def trigger_sonarr_episode_search(episode_id):
     """Trigger a specific episode search in Sonarr"""
     try:
         episode_id_int = int(episode_id)
-        response = requests.post(
+        response = arr_session(settings.SONARR_URL, settings.SONARR_API_KEY).post(
             f"{settings.SONARR_URL}/command",
             json={'name': 'EpisodeSearch', 'episodeIds': [episode_id_int]},
-            headers={'X-Api-Key': settings.SONARR_API_KEY}
+            timeout=ARR_TIMEOUT
         )
         response.raise_for_status()
-        logger.debug(f"Sonarr episode search triggered for episode id {episode_id_int}", extra={'emoji_type': 'debug'})
+        logger.debug(f"Sonarr episode search triggered for episode id {episode_id_int}", extra=LOG_EXTRA['debug'])
         return True
     except Exception as e:
-        logger.error(f"Sonarr episode search failed: {e}", extra={'emoji_type': 'error'})
+        logger.error(f"Sonarr episode search failed: {e}", extra=LOG_EXTRA['error'])
         return False
 
 # Monitoring functions:
-def check_media_has_file(media_id, base_title, rating_key, media_type='movie', attempts=0, season_number=None, episode_number=None, start_time=None, is_4k=False):
+def start_monitor(rating_key):
+    """Begin a new monitor chain for rating_key with fresh state, superseding any running one; returns its generation"""
+    with TIMER_LOCK:
+        generation = next(MONITOR_GENERATION_COUNTER)
+        MONITOR_GENERATIONS[rating_key] = generation
+        MONITOR_STATE[rating_key] = MonitorState()
+        task_id = ACTIVE_SEARCH_TIMERS.pop(rating_key, None)
+    if task_id is not None:
+        scheduler.cancel(task_id)
+    return generation
+
+def end_monitor(rating_key, generation):
+    """Cancel the pending check and drop all per-item bookkeeping, unless a newer chain owns rating_key"""
+    with TIMER_LOCK:
+        if MONITOR_GENERATIONS.get(rating_key) != generation:
+            return
+        del MONITOR_GENERATIONS[rating_key]
+        MONITOR_STATE.pop(rating_key, None)
+        task_id = ACTIVE_SEARCH_TIMERS.pop(rating_key, None)
+    if task_id is not None:
+        scheduler.cancel(task_id)
+
+def get_monitor_state(rating_key, generation):
+    """Return the chain's MonitorState, or None once a newer chain has replaced it"""
+    with TIMER_LOCK:
+        if MONITOR_GENERATIONS.get(rating_key) != generation:
+            return None
+        return MONITOR_STATE[rating_key]
+
+def is_monitored(rating_key):
+    """Lock-free check for a running monitor; a single dict lookup is atomic under the GIL"""
+    return rating_key in MONITOR_GENERATIONS
+
+def fetch_plex_item(section_id, rating_key):
+    return get_plex().library.sectionByID(section_id).fetchItem(int(rating_key))
+
+def _set_plex_item(state, item):
+    state.item = item
+    state.title = item.title
+    state.base = strip_status_markers(item.title)
+
+def load_plex_item(state, section_id, rating_key):
+    """Fetch the Plex item into state unless a previous poll already did"""
+    if state.item is None:
+        _set_plex_item(state, fetch_plex_item(section_id, rating_key))
+
+def set_plex_title(state, new_title):
+    """Edit the Plex title unless it already reads new_title; returns whether an edit was sent"""
+    if state.title == new_title:
+        return False
+    state.item.editTitle(new_title)
+    state.title = new_title
+    return True
+
+def get_sonarr_series(config, tvdb_id):
+    """Return a SeriesRef for a TVDB ID, fetching the series only once per instance"""
+    key = (config['url'], int(tvdb_id))
+    series = SERIES_CACHE.get(key)
+    if series is None:
+        response = arr_session(config['url'], config['api_key']).get(f"{config['url']}/series", params={config['id_type']: tvdb_id}, timeout=ARR_TIMEOUT)
+        response.raise_for_status()
+        series_list = response.json()
+        if not series_list:
+            return None
+        series = SERIES_CACHE[key] = SeriesRef(series_list[0])
+    return series
+
+def forget_sonarr_series(tvdb_id):
+    """Drop a TVDB ID's cached series so the next lookup asks Sonarr again (e.g. after it was deleted)"""
+    tvdb_id = int(tvdb_id)
+    for key in [key for key in list(SERIES_CACHE) if key[1] == tvdb_id]:
+        SERIES_CACHE.pop(key, None)
+
+def get_series_episodes(config, tvdb_id, season_number=None):
+    """Return (series, episodes), looking the series up again once if its cached id yields no episodes"""
+    series = get_sonarr_series(config, tvdb_id)
+    if series is None:
+        return None, None
+    episodes = get_sonarr_episodes(config, series.id, season_number)
+    if not episodes:
+        # A series deleted and re-added in Sonarr gets a new id, and the old one lists no episodes;
+        # only fetch the episodes again if the lookup really turned up a different id
+        stale_id = series.id
+        forget_sonarr_series(tvdb_id)
+        series = get_sonarr_series(config, tvdb_id)
+        if series is None:
+            return None, None
+        if series.id != stale_id:
+            episodes = get_sonarr_episodes(config, series.id, season_number)
+    return series, episodes
+
+def get_sonarr_episodes(config, series_id, season_number=None):
+    """Return a series' episodes (one season's if given), sharing one fetch between monitors polled together"""
+    key = (config['url'], series_id, season_number)
+    cached = EPISODE_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < EPISODE_CACHE_TTL:
+        return cached[1]
+    params = {'seriesId': series_id}
+    if season_number is not None:
+        params['seasonNumber'] = season_number
+    response = arr_session(config['url'], config['api_key']).get(f"{config['url']}/episode", params=params, timeout=ARR_TIMEOUT)
+    if response.status_code == 404:  # unknown series id
+        return []
+    response.raise_for_status()
+    episodes = response.json()
+    now = time.monotonic()
+    # Drop expired lists so finished series don't keep their episode JSON alive
+    for stale in [k for k, (fetched_at, _) in list(EPISODE_CACHE.items()) if now - fetched_at >= EPISODE_CACHE_TTL]:
+        EPISODE_CACHE.pop(stale, None)
+    EPISODE_CACHE[key] = (now, episodes)
+    return episodes
+
+def get_queue_index(config):
+    """Return the download percent of each queued media id, sharing one snapshot per instance between monitors"""
+    url = config['url']
+    cached = QUEUE_CACHE.get(url)
+    if cached and time.monotonic() - cached[0] < QUEUE_CACHE_TTL:
+        return cached[1]
+    lock = QUEUE_FETCH_LOCKS.get(url) or QUEUE_FETCH_LOCKS.setdefault(url, threading.Lock())
+    with lock:
+        # Callers that queued behind an in-flight fetch take its result instead of fetching again
+        cached = QUEUE_CACHE.get(url)
+        if cached and time.monotonic() - cached[0] < QUEUE_CACHE_TTL:
+            return cached[1]
+        # Ask for the whole queue in one page; nested series/episode/movie objects stay excluded (the default)
+        response = arr_session(config['url'], config['api_key']).get(f"{url}/queue", params={'pageSize': QUEUE_PAGE_SIZE}, timeout=ARR_TIMEOUT)
+        response.raise_for_status()
+        records = response.json().get('records', [])
+        # Index once per snapshot rather than once per poll; built from the end so the first
+        # record for an id wins, as with a forward scan. Only the progress is kept, so the cached
+        # snapshot doesn't pin the records and monitors don't recompute it for every poll
+        field = config['queue_id_field']
+        index = {}
+        for record in reversed(records):
+            size = int(record.get('size') or 0)
+            sizeleft = int(record.get('sizeleft') or 0)
+            index[record.get(field)] = max(0, min(100, 100 * (size - sizeleft) // size)) if size else 0
+        QUEUE_CACHE[url] = (time.monotonic(), index)
+    return index
+
+def check_media_has_file(media_id, base_title, rating_key, media_type='movie', attempts=0, season_number=None, episode_number=None, start_time=None, is_4k=False, generation=None):
     """Generic function to check if media has file and monitor downloads"""
+    # Called without a generation this starts a new chain for rating_key; a chain superseded since
+    # (e.g. by a repeated playback) stops without touching the new one's timer or state
+    if generation is None:
+        generation = start_monitor(rating_key)
     try:
         config = get_arr_config(media_type, is_4k)
+        state = get_monitor_state(rating_key, generation)
+        if state is None:
+            return
+        now = time.monotonic()
         if start_time is None:
-            start_time = time.time()
+            start_time = now
         
         # Handle timeout
-        if time.time() - start_time > settings.MAX_MONITOR_TIME:
+        if now - start_time > settings.MAX_MONITOR_TIME:
             try:
-                section = plex.library.sectionByID(config['section_id'])
-                item = section.fetchItem(int(rating_key))
-                base = strip_status_markers(item.title)
+                load_plex_item(state, config['section_id'], rating_key)
+                base = state.base
                 
-                new_title = f"{base} - {'Not Available' if PROGRESS_FLAGS.get(f'{rating_key}_retrying', False) else 'Not Found'}"
-                logger.error(f"{'Retry' if PROGRESS_FLAGS.get(f'{rating_key}_retrying', False) else 'Initial search'} timeout reached for '{base_title}'", 
-                           extra={'emoji_type': 'error'})
+                new_title = base + (STATUS_NOT_AVAILABLE if state.retrying else STATUS_NOT_FOUND)
+                logger.error(f"{'Retry' if state.retrying else 'Initial search'} timeout reached for '{base_title}'", 
+                           extra=LOG_EXTRA['error'])
                 
-                item.editTitle(new_title)
-                item.reload()
+                set_plex_title(state, new_title)
             except Exception as e:
-                logger.error(f"Failed to update Plex title on timeout: {e}", extra={'emoji_type': 'error'})
-            with TIMER_LOCK:
-                ACTIVE_SEARCH_TIMERS.pop(rating_key, None)
+                logger.error(f"Failed to update Plex title on timeout: {e}", extra=LOG_EXTRA['error'])
+            end_monitor(rating_key, generation)
             return
 
-        # Query *arr API for media info
+        # Plex, the *arr item lookup and the *arr queue are independent; run the Plex fetch (unless
+        # a previous poll left the item cached) and the queue fetch while the item lookup runs
+        plex_future = None if state.item is not None else FETCH_EXECUTOR.submit(fetch_plex_item, config['section_id'], rating_key)
+
+        # Query *arr API for media info; targets stays None if the media isn't known there
+        targets = year = queue_future = None
         if media_type == 'movie':
-            response = requests.get(f"{config['url']}/movie", headers={'X-Api-Key': config['api_key']})
+            queue_future = FETCH_EXECUTOR.submit(get_queue_index, config)
+            response = arr_session(config['url'], config['api_key']).get(f"{config['url']}/movie", params={config['id_type']: media_id}, timeout=ARR_TIMEOUT)
             response.raise_for_status()
             items = response.json()
-            target_item = next((m for m in items if int(m.get(config['id_type'], 0)) == int(media_id)), None)
-            item_id = target_item['id'] if target_item else None
+            # *arr ids are JSON ints
+            media_id_int = int(media_id)
+            target_item = next((m for m in items if m.get(config['id_type']) == media_id_int), None)
+            if target_item:
+                targets = [target_item]
+                year = target_item.get('year')
         else:
             # Get series first, then episode
-            series_response = requests.get(f"{config['url']}/series", params={config['id_type']: media_id}, 
-                                        headers={'X-Api-Key': config['api_key']})
-            series_response.raise_for_status()
-            series_list = series_response.json()
-            
-            if series_list:
-                series = series_list[0]
-                episodes_response = requests.get(f"{config['url']}/episode", params={'seriesId': series['id']}, 
-                                              headers={'X-Api-Key': config['api_key']})
-                episodes_response.raise_for_status()
-                episodes = episodes_response.json()
+            queue_future = FETCH_EXECUTOR.submit(get_queue_index, config)
+            # Sonarr's season/episode numbers are JSON ints
+            season = int(season_number) if config['search_type'] in ('episode', 'season') else None
+            # Let Sonarr narrow the list to one season
+            series, episodes = get_series_episodes(config, media_id, season)
 
+            if series:
                 # Filter episodes based on search type
                 if config['search_type'] == 'episode':
-                    target_episodes = [ep for ep in episodes 
-                                    if int(ep.get('seasonNumber', 0)) == int(season_number)
-                                    and int(ep.get('episodeNumber', 0)) == int(episode_number)]
+                    episode = int(episode_number)
+                    targets = [ep for ep in episodes 
+                               if ep.get('seasonNumber') == season
+                               and ep.get('episodeNumber') == episode]
                 elif config['search_type'] == 'season':
-                    target_episodes = [ep for ep in episodes 
-                                    if int(ep.get('seasonNumber', 0)) == int(season_number)]
+                    targets = [ep for ep in episodes 
+                               if ep.get('seasonNumber') == season]
                 else:  # series
-                    target_episodes = episodes
-
-                # Check if all target episodes have files
-                all_available = all(ep.get('hasFile', False) for ep in target_episodes)
-                any_downloading = False
-                progress = 0
-                downloading_count = 0
-
-                # Check queue status for all relevant episodes
-                queue_response = requests.get(f"{config['url']}/queue", headers={'X-Api-Key': config['api_key']})
-                queue_response.raise_for_status()
-                queue_data = queue_response.json()
-                queue_items = queue_data.get('records', [])
+                    targets = episodes
+                year = series.year
+
+        if targets is not None:
+            # Check if all targets have files
+            # No matching episode (e.g. not listed in Sonarr yet) is not "available"; keep monitoring until the timeout
+            all_available = bool(targets) and all(target.get('hasFile', False) for target in targets)
+            any_downloading = False
+            progress = 0
+            downloading_count = 0
+
+            if all_available:
+                # Nothing left to download, so skip the queue fetch
+                queue_future.cancel()
+            else:
+                # Check queue status for all targets
+                queue_index = queue_future.result()
                 
-                for ep in target_episodes:
-                    queue_item = next((qi for qi in queue_items if qi.get(config['queue_id_field']) == ep.get('id')), None)
-                    if queue_item:
+                for target in targets:
+                    percent = queue_index.get(target.get('id'))
+                    if percent is not None:
                         any_downloading = True
                         downloading_count += 1
-                        progress += (1 - (queue_item.get('sizeleft', 0) / queue_item.get('size', 1))) * 100
+                        progress += percent
 
-                # Update Plex title based on status
-                section = plex.library.sectionByID(config['section_id'])
-                item = section.fetchItem(int(rating_key))
-                base = strip_status_markers(item.title)
+            # Update Plex title based on status
+            if plex_future:
+                _set_plex_item(state, plex_future.result())
+            base = state.base
+            if state.display_title is None:
+                # Make sure we use the actual title, not a placeholder
+                state.display_title = strip_status_markers(base_title)
+                if '{episode_title}' in base_title:
+                    state.display_title = f"Episode S{season_number:02d}E{episode_number:02d}"
 
-                if all_available:
-                    new_title = f"{base} - Available"
-                    item.editTitle(new_title)
-                    item.reload()
-                    
-                    # Make sure we use the actual title, not a placeholder
-                    display_title = strip_status_markers(base_title)
-                    if '{episode_title}' in base_title:
-                        display_title = f"Episode S{season_number:02d}E{episode_number:02d}"
-                    
-                    logger.info(f"Updated Plex title to Available for '{display_title}'", 
-                              extra={'emoji_type': 'info'})
-                    
-                    # Delete placeholder files when download is complete
-                    delete_dummy_files(media_type, base_title, series.get('year'), media_id, 
-                                    config['library_folder'], season_number, episode_number)
-                    with TIMER_LOCK:
-                        ACTIVE_SEARCH_TIMERS.pop(rating_key, None)
-                    PROGRESS_FLAGS.pop(rating_key, None)
-                    return
-                elif any_downloading:
-                    # Kill search timer on first download detection
-                    if not PROGRESS_FLAGS.get(rating_key, False):
-                        with TIMER_LOCK:
-                            ACTIVE_SEARCH_TIMERS.pop(rating_key, None)
-                        logger.info(f"Search completed successfully for {base_title}, monitoring download", 
-                                  extra={'emoji_type': 'success'})
-
-                    avg_progress = progress / downloading_count if downloading_count > 0 else 0
-                    new_title = f"{base} - Downloading {int(avg_progress)}%"
-                    PROGRESS_FLAGS[rating_key] = True
-                    
-                    # Format proper title for logging
-                    display_title = strip_status_markers(base_title)
-                    if '{episode_title}' in base_title:
-                        display_title = f"Episode S{season_number:02d}E{episode_number:02d}"
-                        
-                    logger.info(f"Download progress for {display_title}: {int(avg_progress)}%", 
-                              extra={'emoji_type': 'progress'})
-                    item.editTitle(new_title)
-                    item.reload()
+            if all_available:
+                new_title = base + STATUS_AVAILABLE
+                set_plex_title(state, new_title)
+                
+                logger.info(f"Updated Plex title to Available for '{state.display_title}'", 
+                          extra=LOG_EXTRA['info'])
+                
+                # Delete placeholder files when download is complete
+                delete_dummy_files(media_type, base_title, year, media_id, 
+                                config['library_folder'], season_number, episode_number)
+                end_monitor(rating_key, generation)
+                return
+            elif any_downloading:
+                first_progress = not state.downloading
+                if first_progress:
+                    logger.info(f"Search completed successfully for {base_title}, monitoring download", 
+                              extra=LOG_EXTRA['success'])
+
+                avg_progress = progress // downloading_count if downloading_count > 0 else 0
+                # Report progress in PROGRESS_STEP increments so most polls leave the title untouched
+                step = avg_progress // PROGRESS_STEP
+                step_progress = step * PROGRESS_STEP
+                new_title = base + STATUS_DOWNLOADING[step]
+                state.downloading = True
+                
+                # Show the first progress right away, then at most once per PROGRESS_UPDATE_INTERVAL
+                if state.title != new_title and (
+                        first_progress or now - state.last_progress_update >= PROGRESS_UPDATE_INTERVAL):
+                    state.last_progress_update = now
+                    logger.info(f"Download progress for {state.display_title}: {step_progress}%", 
+                              extra=LOG_EXTRA['progress'])
+                    set_plex_title(state, new_title)
+            else:
+                # Handle searching/retrying states
+                if state.downloading:
+                    start_time = now
+                    new_title = base + STATUS_RETRYING
+                    state.downloading = False
+                    state.retrying = True
+                    logger.info(f"Queue item disappeared for {base_title}. Starting new search.", 
+                              extra=LOG_EXTRA['warning'])
+                elif state.retrying:
+                    new_title = base + STATUS_RETRYING
+                    logger.debug("Still retrying search for %s", base_title, extra=LOG_EXTRA['debug'])
                 else:
-                    # Handle searching/retrying states
-                    if PROGRESS_FLAGS.get(rating_key, False):
-                        start_time = time.time()
-                        new_title = f"{base} - Retrying..."
-                        PROGRESS_FLAGS[rating_key] = False
-                        PROGRESS_FLAGS[f"{rating_key}_retrying"] = True
-                        logger.info(f"Queue item disappeared for {base_title}. Starting new search.", 
-                                  extra={'emoji_type': 'warning'})
-                    elif PROGRESS_FLAGS.get(f"{rating_key}_retrying", False):
-                        new_title = f"{base} - Retrying..."
-                        logger.debug(f"Still retrying search for {base_title}", extra={'emoji_type': 'debug'})
-                    else:
-                        new_title = f"{base} - Searching..."
-                        logger.debug(f"No queue item found for {base_title}, still searching.", 
-                                   extra={'emoji_type': 'debug'})
-                    item.editTitle(new_title)
-                    item.reload()
+                    new_title = base + STATUS_SEARCHING
+                    logger.debug("No queue item found for %s, still searching.", base_title,
+                               extra=LOG_EXTRA['debug'])
+                set_plex_title(state, new_title)
 
         # Continue polling
         if attempts < settings.CHECK_MAX_ATTEMPTS:
-            timer = threading.Timer(settings.CHECK_INTERVAL, check_media_has_file, 
-                                 args=[media_id, base_title, rating_key, media_type, attempts+1, 
-                                       season_number, episode_number, start_time])
             with TIMER_LOCK:
-                ACTIVE_SEARCH_TIMERS[rating_key] = timer
-            timer.start()
+                # Only the current chain may reschedule; a superseded one just stops here
+                if MONITOR_GENERATIONS.get(rating_key) == generation:
+                    ACTIVE_SEARCH_TIMERS[rating_key] = scheduler.schedule(
+                        settings.CHECK_INTERVAL, check_media_has_file,
+                        media_id, base_title, rating_key, media_type, attempts+1,
+                        season_number, episode_number, start_time, is_4k, generation)
         else:
-            logger.error(f"Maximum attempts reached for file check of '{base_title}'", extra={'emoji_type': 'error'})
+            logger.error(f"Maximum attempts reached for file check of '{base_title}'", extra=LOG_EXTRA['error'])
             try:
-                item = plex.fetchItem(rating_key)
-                base = strip_status_markers(item.title)
-                new_title = f"{base} - Not Found"
-                item.editTitle(new_title)
-                item.reload()
+                load_plex_item(state, config['section_id'], rating_key)
+                base = state.base
+                new_title = base + STATUS_NOT_FOUND
+                set_plex_title(state, new_title)
             except Exception as e:
-                logger.error(f"Failed to update Plex title on max attempts: {e}", extra={'emoji_type': 'error'})
-            with TIMER_LOCK:
-                ACTIVE_SEARCH_TIMERS.pop(rating_key, None)
+                logger.error(f"Failed to update Plex title on max attempts: {e}", extra=LOG_EXTRA['error'])
+            end_monitor(rating_key, generation)
 
     except Exception as e:
-        logger.error(f"{media_type.title()} file check failed: {e}", extra={'emoji_type': 'error'})
-        with TIMER_LOCK:
-            ACTIVE_SEARCH_TIMERS.pop(rating_key, None)
+        logger.error(f"{media_type.title()} file check failed: {e}", extra=LOG_EXTRA['error'])
+        # The cached item may be what failed (e.g. replaced in Plex); the next monitor starts from a fresh fetch
+        end_monitor(rating_key, generation)
 
 def check_has_file(tmdb_id, base_title, rating_key, attempts=0, start_time=None):
     return check_media_has_file(tmdb_id, base_title, rating_key, 'movie', attempts, start_time=start_time)
@@ -543,13 +832,18 @@ def check_tv_has_file(tvdb_id, base_title, rating_key, attempts=0, season_number
 def update_plex_title(rating_key, base_title, status):
     """Update a Plex item's title using PlexAPI directly rather than URL construction"""
     try:
-        # Get the item directly using PlexAPI
-        item = plex.fetchItem(int(rating_key))
         base_title = strip_status_markers(base_title)
         new_title = f"{base_title} - {status}"
+        # Only reuse state owned by an active monitor, which clears it when it stops
+        state = MONITOR_STATE.get(rating_key)
+        if state and state.title == new_title:
+            return
+        # Get the item directly using PlexAPI
+        item = state.item if state and state.item is not None else get_plex().fetchItem(int(rating_key))
         # Use PlexAPI's built-in title update
         item.editTitle(new_title)
-        item.reload()
-        logger.info(f"Updated Plex title to: {new_title}", extra={'emoji_type': 'update'})
+        if state:
+            state.item, state.title = item, new_title
+        logger.info(f"Updated Plex title to: {new_title}", extra=LOG_EXTRA['update'])
     except Exception as e:
-        logger.error(f"Failed to update Plex title for {rating_key}: {str(e)}", extra={'emoji_type': 'error'})
+        logger.error(f"Failed to update Plex title for {rating_key}: {str(e)}", extra=LOG_EXTRA['error'])
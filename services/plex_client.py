@@ -1,22 +1,130 @@
-import os, urllib.parse
+import re, time, threading, functools, requests
+from typing import Optional
+from plexapi.exceptions import NotFound
 from plexapi.server import PlexServer
 from core.config import settings
-from core.logger import logger
-
-def build_plex_url(path: str) -> str:
-    """Build a complete Plex URL with proper path handling."""
-    # Remove any leading/trailing slashes from both base and path
-    base = settings.PLEX_URL.rstrip('/')
-    clean_path = path.strip('/')
-    
-    # Ensure clean URL construction
-    url = f"{base}/{clean_path}"
-    logger.debug(f"Built Plex URL: {url}", extra={'emoji_type': 'debug'})
-    return url
-
-try:
-    plex = PlexServer(settings.PLEX_URL, settings.PLEX_TOKEN)
-    logger.info("Connected to Plex via PlexAPI.", extra={'emoji_type': 'info'})
-except Exception as e:
-    logger.error(f"Failed to connect to Plex: {e}", extra={'emoji_type': 'error'})
-    plex = None
+from core.logger import logger, LOG_EXTRA
+from services.utils import normalize_title
+
+PLEX_INDEX_TTL = 300  # Seconds before the GUID index is rebuilt from Plex
+PLEX_INDEX_MISS_INTERVAL = 30  # Minimum seconds between rebuilds triggered by a lookup miss
+PLEX_TIMEOUT = (3.05, 30)  # (connect, read) seconds for the raw HTTP calls
+
+# Indexed per library section, so a miss in one only rescans that section
+_plex_index = {
+    "tv": {"shows_by_tvdb": {}, "built_at": None},
+    "movie": {"movies_by_tmdb": {}, "movies_by_title_year": {}, "built_at": None},
+}
+_plex_index_locks = {"tv": threading.Lock(), "movie": threading.Lock()}
+_TVDB_FOLDER_RE = re.compile(r"\{tvdb-(\d+)\}")
+_TMDB_FOLDER_RE = re.compile(r"\{tmdb-(\d+)\}")
+
+# Keep-alive session and base URL for the raw HTTP calls plexapi doesn't cover
+_PLEX_BASE_URL = settings.PLEX_URL.rstrip('/')
+_plex_session = requests.Session()
+_plex_session.headers['X-Plex-Token'] = settings.PLEX_TOKEN
+
+def refresh_plex_section(section_id):
+    """Ask Plex to rescan a library section"""
+    response = _plex_session.get(f"{_PLEX_BASE_URL}/library/sections/{section_id}/refresh", timeout=PLEX_TIMEOUT)
+    response.raise_for_status()
+
+def _guid_id(guids, prefix):
+    """Return the numeric id from the first guid starting with prefix (e.g. 'tvdb://')"""
+    for guid in guids:
+        if guid.id.startswith(prefix):
+            value = guid.id[len(prefix):]
+            return int(value) if value.isdigit() else None
+    return None
+
+def _location_id(item, pattern):
+    """Return the {scheme-id} token embedded in the item's library folder name, if any"""
+    try:
+        locations = item.locations
+    except AttributeError:
+        return None
+    for location in locations or ():
+        m = pattern.search(location)
+        if m:
+            return int(m.group(1))
+    return None
+
+# Only rating keys are kept; holding the PlexObjects would pin the whole library listing in memory.
+# includeGuids makes Plex return the agent guids in the listing itself, otherwise
+# reading .guids on each partial object triggers a full reload (one request per item)
+def _build_tv_index():
+    """Scan the Plex TV section and index show rating keys by TVDB ID"""
+    shows_by_tvdb = {}
+    for show in get_plex().library.sectionByID(settings.PLEX_TV_SECTION_ID).all(includeGuids=True):
+        tvdb_id = _guid_id(show.guids, 'tvdb://') or _location_id(show, _TVDB_FOLDER_RE)
+        if tvdb_id:
+            shows_by_tvdb[tvdb_id] = show.ratingKey
+    _plex_index["tv"].update(shows_by_tvdb=shows_by_tvdb, built_at=time.monotonic())
+    logger.debug(f"Indexed {len(shows_by_tvdb)} shows from Plex", extra=LOG_EXTRA['debug'])
+
+def _build_movie_index():
+    """Scan the Plex movie section and index movie rating keys by TMDB ID and by (title, year)"""
+    movies_by_tmdb, movies_by_title_year = {}, {}
+    for movie in get_plex().library.sectionByID(settings.PLEX_MOVIE_SECTION_ID).all(includeGuids=True):
+        tmdb_id = _guid_id(movie.guids, 'tmdb://') or _location_id(movie, _TMDB_FOLDER_RE)
+        if tmdb_id:
+            movies_by_tmdb[tmdb_id] = movie.ratingKey
+        movies_by_title_year[(normalize_title(movie.title), movie.year)] = movie.ratingKey
+    _plex_index["movie"].update(movies_by_tmdb=movies_by_tmdb, movies_by_title_year=movies_by_title_year,
+                                built_at=time.monotonic())
+    logger.debug(f"Indexed {len(movies_by_tmdb)} movies from Plex", extra=LOG_EXTRA['debug'])
+
+_INDEX_BUILDERS = {"tv": _build_tv_index, "movie": _build_movie_index}
+
+def _lookup_rating_key(section, table, key):
+    """Return the indexed rating key; a miss rescans the section, at most every PLEX_INDEX_MISS_INTERVAL"""
+    index = _plex_index[section]
+    with _plex_index_locks[section]:
+        built_at = index["built_at"]
+        age = None if built_at is None else time.monotonic() - built_at
+        # Items requested moments ago are usually newer than the index, so a miss is worth one rescan
+        if age is None or age > PLEX_INDEX_TTL or (
+                key not in index[table] and age > PLEX_INDEX_MISS_INTERVAL):
+            _INDEX_BUILDERS[section]()
+        return index[table].get(key)
+
+def _fetch_rating_key(rating_key):
+    if rating_key is None:
+        return None
+    try:
+        return get_plex().fetchItem(rating_key)
+    except NotFound:  # removed from Plex since the index was built
+        return None
+
+def find_show_by_id(tvdb_id):
+    """Look up a Plex show by TVDB ID using the cached library index"""
+    try:
+        return _fetch_rating_key(_lookup_rating_key("tv", "shows_by_tvdb", int(tvdb_id)))
+    except Exception as e:
+        logger.error(f"Failed to look up show tvdb-{tvdb_id} in Plex: {e}", extra=LOG_EXTRA['error'])
+        return None
+
+def find_movie_by_id(tmdb_id, title=None, year=None):
+    """Look up a Plex movie by TMDB ID using the cached library index, falling back to title and year"""
+    try:
+        rating_key = _lookup_rating_key("movie", "movies_by_tmdb", int(tmdb_id))
+        if rating_key is None and title and year:
+            rating_key = _lookup_rating_key("movie", "movies_by_title_year", (normalize_title(title), int(year)))
+        return _fetch_rating_key(rating_key)
+    except Exception as e:
+        logger.error(f"Failed to look up movie tmdb-{tmdb_id} in Plex: {e}", extra=LOG_EXTRA['error'])
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _connect() -> PlexServer:
+    server = PlexServer(settings.PLEX_URL, settings.PLEX_TOKEN)
+    logger.info("Connected to Plex via PlexAPI.", extra=LOG_EXTRA['info'])
+    return server
+
+def get_plex() -> Optional[PlexServer]:
+    """Return the shared PlexServer, connecting on first use (failed attempts are retried next call)"""
+    try:
+        return _connect()
+    except Exception as e:
+        logger.error(f"Failed to connect to Plex: {e}", extra=LOG_EXTRA['error'])
+        return None
@@ -1,19 +1,24 @@
 import os  # <-- required for get_series_folder
 import re
+import functools
 from pathlib import Path
+from urllib.parse import urlparse
 from core.config import settings
 
+_ILLEGAL_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+# Every " - <status>" suffix the monitors write into Plex titles (see the STATUS_* constants in integrations)
+_STATUS_SUFFIX_RE = re.compile(r"\s*-\s*(\[Request\]|Searching\.\.\.|Retrying\.\.\.|Available|Not Available|"
+                               r"Not Found(\s*-\s*Search Timeout)?|Downloading\s+\d+%)\s*$", re.IGNORECASE)
+_MOVIE_STATUS_RE = re.compile(r"\s*-\s*(Searching|Not Found - Search Timeout|Downloading\s+\d+%)(\s*-\s*)?$", re.IGNORECASE)
+
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]', '', name).strip()
+    return name.translate(_ILLEGAL_FILENAME_CHARS).strip()
 
 def dedup_title(title: str) -> str:
-    parts = [p.strip() for p in title.split(' - ')]
-    seen, deduped = set(), []
-    for part in parts:
-        if part not in seen:
-            seen.add(part)
-            deduped.append(part)
-    return " - ".join(deduped)
+    # dict keys keep first-seen order, so one insert per part both dedupes and preserves order
+    return " - ".join(dict.fromkeys(p.strip() for p in title.split(' - ')))
 
 def extract_episode_title(raw_title: str) -> str:
     clean = raw_title.split('[')[0].strip()
@@ -25,21 +30,32 @@ def extract_episode_title(raw_title: str) -> str:
     return clean
 
 def strip_movie_status(title: str) -> str:
-    pattern = re.compile(r"\s*-\s*(Searching|Not Found - Search Timeout|Downloading\s+\d+%)(\s*-\s*)?$", re.IGNORECASE)
+    if '-' not in title:  # every status suffix starts with a dash
+        return title.strip()
     prev = None
     while prev != title:
         prev = title
-        title = pattern.sub("", title).strip()
+        title = _MOVIE_STATUS_RE.sub("", title).strip()
     return title
 
+def normalize_title(title: str) -> str:
+    """Reduce a title to a lookup key that ignores case, punctuation, spacing and our status suffixes"""
+    # Only strip trailing statuses; cutting at the first dash would make "X-Men" and "X-Files" both "x"
+    prev = None
+    while prev != title:
+        prev = title
+        title = _STATUS_SUFFIX_RE.sub("", title)
+    return " ".join(_NON_WORD_RE.sub(" ", title).casefold().split())
+
 def strip_status_markers(title: str) -> str:
     """Keep only the base title by removing everything after first dash or bracket"""
-    # First split on '[' and take the first part
-    title = title.split('[')[0].strip()
-    # Then split on '-' and take the first part
-    title = title.split('-')[0].strip()
-    # Clean up any extra whitespace
-    title = re.sub(r'\s+', ' ', title).strip()
+    # First cut at the first '[', then at the first '-'; most titles have neither, so skip the split
+    if '[' in title:
+        title = title.split('[', 1)[0]
+    if '-' in title:
+        title = title.split('-', 1)[0]
+    # Clean up any extra whitespace (this also strips what the cuts left at the ends)
+    title = _WHITESPACE_RE.sub(' ', title).strip()
     # Remove ellipsis if present
     title = title.replace('...', '')
     return title
@@ -50,30 +66,63 @@ def get_series_folder(media_type, target_base_folder, title, year, media_id, sea
     folder = f"{clean_title}{year_str} {{tmdb-{media_id}}}" if media_type == 'movie' else f"{clean_title}{year_str} {{tvdb-{media_id}}}"
     return os.path.join(target_base_folder, folder)
 
+def _build_library_trie() -> dict:
+    """Index the configured library roots by path component; the None key marks a root"""
+    trie = {}
+    for folder, library in ((settings.MOVIE_LIBRARY_FOLDER, ('movie', False)),
+                            (settings.TV_LIBRARY_FOLDER, ('tv', False)),
+                            (settings.MOVIE_LIBRARY_4K_FOLDER, ('movie', True)),
+                            (settings.TV_LIBRARY_4K_FOLDER, ('tv', True))):
+        if not folder:
+            continue
+        node = trie
+        for part in Path(folder).parts:
+            node = node.setdefault(part, {})
+        node[None] = library
+    return trie
+
+LIBRARY_TRIE = _build_library_trie()
+# Settings properties recompute on every access (the ports parse a URL); read them once
+HAS_4K_SUPPORT = settings.has_4k_support
+# Parse the ports directly: a 4K URL without an explicit port (e.g. behind a reverse proxy) has none to match
+ARR_4K_PORTS = frozenset(
+    port for port in (urlparse(url).port for url in (settings.RADARR_4K_URL, settings.SONARR_4K_URL) if url)
+    if port is not None
+) if HAS_4K_SUPPORT else frozenset()
+
+def get_library_for_path(file_path: str):
+    """Return (media_type, is_4k) for the deepest library root containing file_path, or None"""
+    node, library = LIBRARY_TRIE, None
+    for part in Path(file_path).parts:
+        node = node.get(part)
+        if node is None:
+            break
+        library = node.get(None, library)
+    return library
+
 def is_4k_request(file_path: str, source_port: int = None) -> bool:
     """
     Determine if this is a 4K request based on:
     1. File path (if it's in a 4K library)
     2. Source port (if it matches a 4K *arr instance)
     """
-    if not settings.has_4k_support:
+    if not HAS_4K_SUPPORT:
         return False
 
     # Check if path is in 4K library
-    if settings.MOVIE_LIBRARY_4K_FOLDER and file_path.startswith(settings.MOVIE_LIBRARY_4K_FOLDER):
-        return True
-    if settings.TV_LIBRARY_4K_FOLDER and file_path.startswith(settings.TV_LIBRARY_4K_FOLDER):
+    library = get_library_for_path(file_path)
+    if library and library[1]:
         return True
     
     # Check if request came from 4K instance
-    if source_port:
-        if source_port == settings.radarr_4k_port or source_port == settings.sonarr_4k_port:
-            return True
+    if source_port in ARR_4K_PORTS:
+        return True
     
     return False
 
+@functools.lru_cache(maxsize=None)
 def get_arr_config(media_type: str, is_4k: bool = False) -> dict:
-    """Get appropriate *arr configuration based on media type and quality"""
+    """Get appropriate *arr configuration based on media type and quality (shared, treat as read-only)"""
     if media_type == "movie":
         return {
             "url": settings.RADARR_4K_URL if is_4k else settings.RADARR_URL,